@@ -1,5 +1,6 @@
 import abc
 import asyncio.coroutines
+import string
 import sys
 import typing as t
 
@@ -91,11 +92,28 @@ class BaseListener(abc.ABC, t.Generic[P, T, types_.InteractionT]):
             self.regex = utils.ensure_compiled(regex)
             self.id_spec = utils.id_spec_from_regex(self.regex)
             self.sep = None
+            self._regex_fullmatch = self.regex.fullmatch
 
         else:
             self.regex = None
             self.id_spec = utils.id_spec_from_signature(self.name or "", sep, self._signature)
             self.sep = sep
+            self._name_prefix = (self.name or "") + sep
+
+        # Pick the matching strategy once; listeners use this directly when invoked, such that
+        # custom_ids meant for other listeners do not need to raise (and format) an exception.
+        # Subclasses that override `parse_custom_id` are dispatched through their override.
+        if type(self).parse_custom_id is not BaseListener.parse_custom_id:
+            self._match_custom_id = self._match_parse_custom_id
+        elif self.regex:
+            self._match_custom_id = self._match_regex
+        else:
+            self._match_custom_id = self._match_spec
+
+        # The id spec is parsed into (literal, field name) pairs on the first call to
+        # `build_custom_id`, such that building custom ids need not parse the format string every
+        # time. This is deferred as custom regex need not be a valid format string.
+        self._id_spec_parts: t.Optional[t.Tuple[t.Tuple[str, t.Optional[str]], ...]] = None
 
     def __get__(self: ListenerT, instance: t.Optional[t.Any], _) -> ListenerT:
         """Abuse descriptor functionality to inject instance of the owner class as first arg."""
@@ -121,6 +139,10 @@ class BaseListener(abc.ABC, t.Generic[P, T, types_.InteractionT]):
     def parse_custom_id(self, custom_id: str) -> t.Tuple[str, ...]:
         """Parse an incoming custom_id into its name and raw parameter values.
 
+        Listeners use this to parse the custom_id of incoming interactions. Subclasses may
+        override this method to customize parsing; a :class:`ValueError` signals that the
+        custom_id does not belong to the listener, in which case the interaction is ignored.
+
         Parameters
         ----------
         custom_id: :class:`str`
@@ -136,18 +158,40 @@ class BaseListener(abc.ABC, t.Generic[P, T, types_.InteractionT]):
         Tuple[:class:`str`, ...]:
             The raw parameter values extracted from the custom_id.
         """
-        if self.regex:
-            match = self.regex.fullmatch(custom_id)
-            if not match or len(params := match.groupdict()) != len(self.params):
-                raise ValueError(f"Regex pattern {self.regex} did not match custom_id {custom_id}.")
+        if (params := self._match_custom_id(custom_id)) is not None:
+            return params
 
-            return tuple(params.values())
+        if self.regex:
+            raise ValueError(f"Regex pattern {self.regex} did not match custom_id {custom_id}.")
+        raise ValueError(f"Listener spec {self.id_spec} did not match custom_id {custom_id}.")
+
+    def _match_parse_custom_id(self, custom_id: str) -> t.Optional[t.Tuple[str, ...]]:
+        """For internal use only. Match a custom_id through an overridden `parse_custom_id`."""
+        try:
+            return self.parse_custom_id(custom_id)
+        except ValueError:
+            return None
+
+    def _match_regex(self, custom_id: str) -> t.Optional[t.Tuple[str, ...]]:
+        """For internal use only. Match a custom_id against the listener's custom regex."""
+        match = self._regex_fullmatch(custom_id)
+        if not match or len(params := match.groupdict()) != len(self.params):
+            return None
+
+        return tuple(params.values())
+
+    def _match_spec(self, custom_id: str) -> t.Optional[t.Tuple[str, ...]]:
+        """For internal use only. Match a custom_id against the listener's name and separator."""
+        # Every listener receives every interaction, so cheaply reject custom_ids that belong to
+        # other listeners before splitting them.
+        if self.name and custom_id != self.name and not custom_id.startswith(self._name_prefix):
+            return None
 
         name, *params = custom_id.split(self.sep)
         # If no name is set, skip name check. Otherwise, assure stored and provided name are equal.
         # Also confirm the number of incoming params matches the number of params on the listener.
         if (self.name and name != self.name) or (len(params) != len(self.params)):
-            raise ValueError(f"Listener spec {self.id_spec} did not match custom_id {custom_id}.")
+            return None
 
         return tuple(params)
 
@@ -192,9 +236,17 @@ class BaseListener(abc.ABC, t.Generic[P, T, types_.InteractionT]):
             for param in self.params
         }
 
-        if self.regex:
-            custom_id = self.id_spec.format(**serialized_kwargs)
-        custom_id = self.id_spec.format(sep=self.sep, **serialized_kwargs)
+        if (id_spec_parts := self._id_spec_parts) is None:
+            id_spec_parts = self._id_spec_parts = tuple(
+                (literal, field) for literal, field, _, _ in string.Formatter().parse(self.id_spec)
+            )
+
+        custom_id = "".join(
+            [
+                literal if field is None else literal + serialized_kwargs[field]
+                for literal, field in id_spec_parts
+            ]
+        )
 
         if not custom_id:  # Fallback in case the listener has neither a name nor params.
             return self.__name__
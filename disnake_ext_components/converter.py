@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import typing as t
 
@@ -18,6 +19,10 @@ ConverterSig = t.Union[
 ]
 ChannelT = t.TypeVar("ChannelT", disnake.abc.GuildChannel, disnake.Thread)
 FlagT = t.TypeVar("FlagT", bound=disnake.flags.BaseFlags)
+T = t.TypeVar("T")
+
+_NOT_FOUND = "Could not find a {kind} with id {id}."
+_CHANNEL_NOT_FOUND = "Could not find a channel of type {type} with id {id}."
 
 
 class ALLOW_CONVERTER_FETCHING:  # There's probably a better way of doing this...
@@ -38,6 +43,28 @@ class ALLOW_CONVERTER_FETCHING:  # There's probably a better way of doing this..
     """Whether or not to allow converters to fetch a message if getting it from cache fails."""
 
 
+def _not_found(kind: str, argument: str) -> ValueError:
+    """Create the error raised when a converter could not find the object with the given id."""
+    return ValueError(_NOT_FOUND.format(kind=kind, id=argument))
+
+
+async def _first_fetched(fetches: t.Iterable[t.Awaitable[t.Optional[T]]]) -> t.Optional[T]:
+    """Run fetches concurrently and return the first result (in order) that is not ``None``.
+    Should all fetches fail, the first exception that was raised is re-raised.
+    """
+    error: t.Optional[BaseException] = None
+    for result in await asyncio.gather(*fetches, return_exceptions=True):
+        if isinstance(result, BaseException):
+            error = error or result
+        elif result is not None:
+            return result
+
+    if error:
+        raise error
+
+    return None
+
+
 def collection_converter(
     collection_type: t.Type[CollectionT],
     inner_converter: ConverterSig,
@@ -64,14 +91,17 @@ def collection_converter(
 
 def make_channel_converter(type_: t.Type[ChannelT]) -> t.Callable[..., types_.Coro[ChannelT]]:
     """Create a channel converter for a given channel type."""
+    type_repr = repr(type_)
 
     async def _convert_channel(argument: str, inter: disnake.Interaction) -> ChannelT:
+        bot = inter.bot
         id = int(argument)
-        if not (channel := inter.bot.get_channel(id)) and ALLOW_CONVERTER_FETCHING.CHANNELS:
-            channel = await inter.bot.fetch_channel(id)
+        if not (channel := bot.get_channel(id)) and ALLOW_CONVERTER_FETCHING.CHANNELS:
+            channel = await bot.fetch_channel(id)
 
-        if not channel or not isinstance(channel, type_):
-            raise ValueError(f"Could not find a channel of type {type_!r} with id {argument}.")
+        # Exact type match first; only fall back to isinstance for subclasses/ABCs.
+        if not channel or (type(channel) is not type_ and not isinstance(channel, type_)):
+            raise ValueError(_CHANNEL_NOT_FOUND.format(type=type_repr, id=argument))
 
         return channel
 
@@ -99,12 +129,13 @@ async def user_converter(argument: str, inter: disnake.Interaction) -> disnake.U
     :class:`disnake.User`
         The user with the provided user id.
     """
+    bot = inter.bot
     id = int(argument)
-    if not (user := inter.bot.get_user(id)) and ALLOW_CONVERTER_FETCHING.USERS:
-        user = await inter.bot.fetch_user(id)
+    if not (user := bot.get_user(id)) and ALLOW_CONVERTER_FETCHING.USERS:
+        user = await bot.fetch_user(id)
 
     if not user:
-        raise ValueError(f"Could not find a user with id {argument}.")
+        raise _not_found("user", argument)
 
     return user
 
@@ -130,12 +161,13 @@ async def guild_converter(argument: str, inter: disnake.Interaction) -> disnake.
     :class:`disnake.Guild`
         The guild with the provided guild id.
     """
+    bot = inter.bot
     id = int(argument)
-    if not (guild := inter.bot.get_guild(id)) and ALLOW_CONVERTER_FETCHING.GUILDS:
-        guild = await inter.bot.fetch_guild(id)
+    if not (guild := bot.get_guild(id)) and ALLOW_CONVERTER_FETCHING.GUILDS:
+        guild = await bot.fetch_guild(id)
 
     if not guild:
-        raise ValueError(f"Could not find a guild with id {argument}.")
+        raise _not_found("guild", argument)
 
     return guild
 
@@ -176,18 +208,13 @@ async def message_converter(
     if not ALLOW_CONVERTER_FETCHING.MESSAGES:
         raise commands.MessageNotFound(argument)
 
-    async def _underlying(channel: disnake.abc.Messageable) -> t.Optional[disnake.Message]:
-        return await channel.fetch_message(id)
-
     entries = {inter.channel}.union(converted or {})
-    for entry in entries:
-        if not isinstance(entry, disnake.abc.Messageable):
-            continue
-        if message := await _underlying(entry):
-            return message
+    channels = [entry for entry in entries if isinstance(entry, disnake.abc.Messageable)]
+
+    if message := await _first_fetched(channel.fetch_message(id) for channel in channels):
+        return message
 
-    else:
-        raise ValueError(f"Could not find a message with id {argument}.")
+    raise _not_found("message", argument)
 
 
 async def member_converter(
@@ -220,20 +247,20 @@ async def member_converter(
     """
     id = int(argument)
 
-    async def _underlying(guild: disnake.Guild) -> t.Optional[disnake.Member]:
-        if not (member := guild.get_member(id)) and ALLOW_CONVERTER_FETCHING.USERS:
-            member = await guild.fetch_member(id)
-        return member
-
     entries = {inter.guild}.union(converted or {})
-    for entry in entries:
-        if not isinstance(entry, disnake.Guild):
-            continue
-        if member := await _underlying(entry):
+    guilds = [entry for entry in entries if isinstance(entry, disnake.Guild)]
+
+    # Exhaust the cache of every guild before making any requests.
+    for guild in guilds:
+        if member := guild.get_member(id):
             return member
 
-    else:
-        raise ValueError(f"Could not find a member with id {argument}.")
+    if ALLOW_CONVERTER_FETCHING.USERS and (
+        member := await _first_fetched(guild.fetch_member(id) for guild in guilds)
+    ):
+        return member
+
+    raise _not_found("member", argument)
 
 
 async def role_converter(
@@ -266,21 +293,24 @@ async def role_converter(
     """
     id = int(argument)
 
-    async def _underlying(guild: disnake.Guild) -> t.Optional[disnake.Role]:
-        if not (role := guild.get_role(id)) and ALLOW_CONVERTER_FETCHING.GUILDS:
-            all_roles = await guild.fetch_roles()
-            role = next((role for role in all_roles if role.id == id), None)
-        return role
+    async def _fetch(guild: disnake.Guild) -> t.Optional[disnake.Role]:
+        all_roles = await guild.fetch_roles()
+        return next((role for role in all_roles if role.id == id), None)
 
     entries = {inter.guild}.union(converted or {})
-    for entry in entries:
-        if not isinstance(entry, disnake.Guild):
-            continue
-        if role := await _underlying(entry):
+    guilds = [entry for entry in entries if isinstance(entry, disnake.Guild)]
+
+    # Exhaust the cache of every guild before making any requests.
+    for guild in guilds:
+        if role := guild.get_role(id):
             return role
 
-    else:
-        raise ValueError(f"Could not find a role with id {argument}.")
+    if ALLOW_CONVERTER_FETCHING.GUILDS and (
+        role := await _first_fetched(_fetch(guild) for guild in guilds)
+    ):
+        return role
+
+    raise _not_found("role", argument)
 
 
 def snowflake_to_str(snowflake: disnake.abc.Snowflake) -> str:
@@ -289,9 +319,10 @@ def snowflake_to_str(snowflake: disnake.abc.Snowflake) -> str:
 
 def make_flag_converter(type_: t.Type[FlagT]) -> t.Callable[..., FlagT]:
     """Create a flag converter for a given flag type."""
+    from_value = type_._from_value  # pyright: ignore[reportUnknownMemberType]
 
     def _convert_flag(argument: str, inter: disnake.Interaction) -> FlagT:
-        return type_._from_value(int(argument))  # pyright: ignore[reportUnknownMemberType]
+        return from_value(int(argument))
 
     return _convert_flag
 
@@ -185,12 +185,10 @@ class ButtonListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
         if (custom_id := inter.component.custom_id) is None:
             return
 
-        try:
-            custom_id_params = self.parse_custom_id(custom_id)
-        except ValueError:
+        if (custom_id_params := self._match_custom_id(custom_id)) is None:
             return
 
-        if not await utils.assert_all_checks(self.checks, inter):
+        if self.checks and not await utils.assert_all_checks(self.checks, inter):
             return
 
         converted: t.Dict[str, t.Any] = {}
@@ -199,7 +197,6 @@ class ButtonListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
                 arg,
                 inter=inter,
                 converted=list(converted.values()),
-                skip_validation=bool(self.regex),
             )
 
         return await super().__call__(inter, **converted)
@@ -345,6 +342,11 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
     reference: types_.AbstractComponent
     """A reference component used to set default values in `~.build_component`."""
 
+    literal_options: t.Optional[t.Tuple[str, ...]]
+    """The select options inferred from the select parameter if it is annotated as a
+    :class:`typing.Literal`, used as default options in `~.build_component`. `None` otherwise.
+    """
+
     def __init__(
         self,
         callback: SelectListenerCallback[ParentT, P, T],
@@ -369,9 +371,16 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
             self.select_param = params.ParamInfo.from_param(param := special_params[0])
             self.reference = self._choose_optimal_reference(reference, param)
 
+            # Infer options from `typing.Literal` once, rather than on every build.
+            if types_.get_origin(param.annotation) is t.Literal:
+                self.literal_options = tuple(str(arg) for arg in types_.get_args(param.annotation))
+            else:
+                self.literal_options = None
+
         else:
             self.select_param = None
             self.reference = self._choose_optimal_reference(reference, None)
+            self.literal_options = None
 
     def _choose_optimal_reference(
         self,
@@ -430,12 +439,10 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
         if not inter.values or (custom_id := inter.component.custom_id) is None:
             return
 
-        try:
-            custom_id_params = self.parse_custom_id(custom_id)
-        except ValueError:
+        if (custom_id_params := self._match_custom_id(custom_id)) is None:
             return
 
-        if not await utils.assert_all_checks(self.checks, inter):
+        if self.checks and not await utils.assert_all_checks(self.checks, inter):
             return
 
         # First convert custom_id params...
@@ -445,7 +452,6 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
                 arg,
                 inter=inter,
                 converted=list(converted.values()),
-                skip_validation=bool(self.regex),
             )
 
         # User didn't supply select params, can still be accessed through inter.values; return.
@@ -454,7 +460,7 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
 
         # User did supply select params, convert inter.values and provide it to the param.
         converted_values = await self.select_param.convert(
-            inter.values, inter=inter, converted=converted
+            inter.values, inter=inter, converted=list(converted.values())
         )
 
         return await super().__call__(inter, converted_values, **converted)
@@ -485,13 +491,9 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
         :class:`disnake.ui.Select`
             The newly created select.
         """
-        if self.select_param:
-            # We need the underlying `inspect.Parameter` here...
-            param = self.select_param.param
-
-            # Parse options from `typing.Literal` if none were provided.
-            if options is None and types_.get_origin(param.annotation) is t.Literal:
-                options = [str(arg) for arg in types_.get_args(param.annotation)]
+        # Use options parsed from `typing.Literal` if none were provided.
+        if options is None and self.literal_options is not None:
+            options = list(self.literal_options)
 
         return self.reference.with_overrides(
             placeholder=placeholder,
@@ -652,12 +654,10 @@ class ModalListener(abc.BaseListener[P, T, disnake.ModalInteraction]):
         if list(inter.text_values) != self.field_ids:
             return
 
-        try:
-            custom_id_params = self.parse_custom_id(inter.custom_id)
-        except ValueError:
+        if (custom_id_params := self._match_custom_id(inter.custom_id)) is None:
             return
 
-        if not await utils.assert_all_checks(self.checks, inter):
+        if self.checks and not await utils.assert_all_checks(self.checks, inter):
             return
 
         converted: t.Dict[str, t.Any] = {}
@@ -666,7 +666,6 @@ class ModalListener(abc.BaseListener[P, T, disnake.ModalInteraction]):
                 arg,
                 inter=inter,
                 converted=list(converted.values()),
-                skip_validation=bool(self.regex),
             )
 
         for param, field_id in zip(self.modal_params, self.field_ids):
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import collections.abc
 import inspect
+import itertools
 import re
 import sys
 import typing as t
@@ -20,6 +23,9 @@ else:
     _UnionTypes = {t.Union}
     _NoneTypes = {None, type(None)}
 
+_StringTypes = frozenset({str, bytes})
+_BuiltinCollectionTypes = frozenset({list, tuple, set, frozenset, dict})
+
 __all__: t.List[str] = ["SelectValue", "ModalValue", "ParagraphModalValue"]
 
 
@@ -31,6 +37,19 @@ ConverterData = t.Tuple[
 ]
 """Parsed converter data."""
 
+ConverterSpec = t.Tuple[t.FrozenSet[str], bool]
+"""Converter data: the names of the parameters it accepts, and whether it is a coroutine function."""
+
+ParsedAnnotation = t.Tuple[
+    t.Tuple[t.Pattern[str], ...],
+    t.Tuple[converter.ConverterSig, ...],
+    t.Tuple[converter.ConverterSig, ...],
+    bool,
+]
+"""Parsed annotation data: regex patterns, converters to and from, and whether the annotation
+contained ``None``.
+"""
+
 
 REGEX_MAP: t.Dict[type, t.Pattern[str]] = {
     # fmt: off
@@ -60,13 +79,16 @@ class ParamInfo:
     to any of the parameter's annotated types.
     """
 
-    param: inspect.Parameter
-    """The listener parameter this :class:`ParamInfo` expands on."""
-
-    converters_to: t.Tuple[converter.ConverterSig]
-    """A list of converter functions used to convert the parameters. In param conversion,
-    the converter is only called when the input argument matches the regex pattern.
-    """
+    __slots__ = (
+        "_param",
+        "_default",
+        "_default_factory",
+        "_converters_to",
+        "_converter_specs",
+        "converters_from",
+        "regex",
+        "_container_type",
+    )
 
     converters_from: t.Tuple[converter.ConverterSig]
     """A list of converter functions used to convert the parameters. In param conversion,
@@ -91,6 +113,47 @@ class ParamInfo:
         self.converters_from = () if converters_from is None else tuple(converters_from)
         self.regex = () if regex is None else tuple(regex)
 
+        # The annotation never changes, so the container type need only be determined once.
+        origin = t.get_origin(param.annotation) or param.annotation
+        if _is_collection_type(origin) and origin not in _StringTypes:
+            self._container_type = t.cast(type, origin)
+        else:
+            self._container_type = None
+
+    @property
+    def converters_to(self) -> t.Tuple[converter.ConverterSig, ...]:
+        """A list of converter functions used to convert the parameters. In param conversion,
+        the converter is only called when the input argument matches the regex pattern.
+        """
+        return self._converters_to
+
+    @converters_to.setter
+    def converters_to(self, converters_to: t.Sequence[converter.ConverterSig]) -> None:
+        self._converters_to = tuple(converters_to)
+        # Inspect the converters once, rather than on every conversion.
+        self._converter_specs = tuple(map(_try_get_converter_spec, self._converters_to))
+
+    @property
+    def param(self) -> inspect.Parameter:
+        """The listener parameter this :class:`ParamInfo` expands on."""
+        return self._param
+
+    @param.setter
+    def param(self, param: inspect.Parameter) -> None:
+        self._param = param
+
+        # Resolve special defaults once, rather than every time the default is needed. Mutable
+        # defaults get a factory instead, such that conversions never share the same object.
+        self._default_factory: t.Optional[t.Callable[[], t.Any]] = None
+        if isinstance(default := param.default, _ModalValue):
+            self._default = inspect.Parameter.empty if default.required else default.value
+        elif isinstance(default, _SelectValue):
+            self._default = inspect.Parameter.empty
+            if default.min_values == 0:
+                self._default_factory = list
+        else:
+            self._default = default
+
     @classmethod
     def from_param(cls, param: inspect.Parameter, validate: bool = True) -> ParamInfo:
         """Build a :class:`ParamInfo` from a given parameter.
@@ -146,100 +209,30 @@ class ParamInfo:
         if annotation is inspect.Parameter.empty:
             annotation = str
 
-        if isinstance(annotation, types_.Converted):
-            return self._parse_converted(annotation)
-
-        if not (origin := types_.get_origin(annotation)):
-            conv_to, conv_from = converter.CONVERTER_MAP[annotation]
-            return [REGEX_MAP[annotation]], ([conv_to], [conv_from])
-
-        elif origin in _UnionTypes:
-            return self._parse_union(annotation)
-
-        elif origin is t.Literal:
-            return self._parse_literal(annotation)
+        regex, conv_to, conv_from, optional = _parse_annotation(annotation)
 
-        try:
-            if issubclass(origin, t.Collection):
-                # Ignore collection and parse first underlying type. Collection parsing is handled
-                # by input to :meth:`self.convert` instead.
-                return self.parse_annotation(
-                    args[0] if (args := types_.get_args(annotation)) else str
-                )
-
-        except TypeError:
-            pass
-
-        raise TypeError(f"{annotation!r} is not a valid type annotation for a listener.")
-
-    def _parse_union(self, annotation: t.Any) -> ConverterData:
-        """Parse a :class:`typing.Union` annotation into the corresponding regex patterns and
-        converter functions. Automatically removes any ``None``s from the union and sets
-        :attr:`ParamInfo.default` to ``None`` if it is not yet set.
-        """
-        if types_.get_origin(annotation) in _UnionTypes:
-            regex: t.List[t.Pattern[str]] = []
-            conv_to: t.List[converter.ConverterSig] = []
-            conv_from: t.List[converter.ConverterSig] = []
-
-            for arg in types_.get_args(annotation):
-                if arg in _NoneTypes:
-                    if self.param.default is inspect.Parameter.empty:
-                        self.param = self.param.replace(default=None)
-                    continue
-
-                arg_regex, (arg_conv_to, arg_conv_from) = self.parse_annotation(arg)
-                regex += arg_regex
-                conv_to += arg_conv_to
-                conv_from += arg_conv_from
-
-            return regex, (conv_to, conv_from)
-
-        raise TypeError(f"{annotation!r} is not a valid typing.Union.")
-
-    def _parse_literal(self, annotation: t.Any) -> ConverterData:
-        """Parse a :class:`typing.Literal` annotation into the corresponding regex patterns and
-        converter functions.
-        """
-        if types_.get_origin(annotation) is t.Literal:
-            regex: t.List[t.Pattern[str]] = []
-            conv_to: t.List[converter.ConverterSig] = []
-            conv_from: t.List[converter.ConverterSig] = []
-
-            for arg in types_.get_args(annotation):
-                regex.append(re.compile(re.escape(str(arg))))
-                arg_conv_to, arg_conv_from = converter.CONVERTER_MAP[type(arg)]
-                conv_to.append(arg_conv_to)
-                conv_from.append(arg_conv_from)
-
-            return regex, (conv_to, conv_from)
+        # Optional annotations without a default implicitly default to `None`.
+        if optional and self.param.default is inspect.Parameter.empty:
+            self.param = self.param.replace(default=None)
 
-        raise TypeError(f"{annotation!r} is not a valid typing.Literal.")
-
-    def _parse_converted(self, annotation: types_.Converted) -> ConverterData:
-        """Parse a :class:`.Converted` annotation into the corresponding regex patterns and
-        converter functions.
-        """
-        return [annotation.regex], ([annotation.converter_to], [annotation.converter_from])
+        return list(regex), (list(conv_to), list(conv_from))
 
     @property
     def default(self) -> t.Any:
         """The default value of the parameter, used if all conversions fail. If this is
         `inspect.Parameter.empty`, this parameter is considered default-less, and thus required.
         """
-        if isinstance(default := self.param.default, _ModalValue):
-            return inspect.Parameter.empty if default.required else default.value
-        elif isinstance(default, _SelectValue):
-            lst: t.List[t.Any] = []
-            return lst if default.min_values == 0 else inspect.Parameter.empty
-        return default
+        if self._default_factory is not None:
+            return self._default_factory()
+        return self._default
 
     @property
     def optional(self) -> bool:
         """Whether or not this parameter is optional. If the parameter is default-less and optional,
         the parameter will instead default to `None`.
         """
-        return self.default not in {inspect.Parameter.empty, Ellipsis}
+        default = self.default
+        return default is not inspect.Parameter.empty and default is not Ellipsis
 
     @property
     def name(self) -> str:
@@ -251,14 +244,7 @@ class ParamInfo:
         """The container type, if any. For example, a parameter annotated as ``List[str]``
         would have container type ``list``.
         """
-        annotation = self.param.annotation
-        origin = t.get_origin(annotation) or annotation
-        try:
-            if issubclass(origin, t.Collection) and origin not in {str, bytes}:
-                return t.cast(type, origin)
-        except TypeError:
-            pass
-        return None
+        return self._container_type
 
     @t.overload
     async def convert(self, argument: str, **kwargs: t.Any) -> t.Any:
@@ -308,7 +294,19 @@ class ParamInfo:
                     f"Failed to convert parameter {self.param.name}", self.param, [exc]
                 )
 
-            converted = [result for arg in argument for result in await self.convert(arg, **kwargs)]
+            if len(argument) > 1 and any(spec and spec[1] for spec in self._converter_specs):
+                # Values are converted independently, so async converters can run concurrently.
+                results = await asyncio.gather(
+                    *(self.convert(arg, **kwargs) for arg in argument), return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+
+            else:
+                results = [await self.convert(arg, **kwargs) for arg in argument]
+
+            converted = [result for arg_results in results for result in arg_results]
             return self.container_type(converted)
 
         method = self._convert_and_validate if self.regex else self._convert_raw
@@ -327,9 +325,9 @@ class ParamInfo:
         """For internal use only. Run converters on an argument without regex validation."""
         errors: t.List[ValueError] = []
 
-        for conv in self.converters_to:
+        for conv, spec in zip(self._converters_to, self._converter_specs):
             try:
-                return await self._actual_conversion(argument, conv, **kwargs)
+                return await self._actual_conversion(argument, conv, spec, **kwargs)
             except ValueError as exc:
                 errors.append(exc)
 
@@ -342,49 +340,62 @@ class ParamInfo:
         can be of the correct type using regex.
         """
         match_cache: t.Set[t.Pattern[str]] = set()  # Prevent matching the same regex again.
-        errors: t.List[ValueError] = []
+        # Failed patterns are stored as-is, and are only turned into proper exceptions in case all
+        # conversions fail. This way, no work is wasted on errors that end up being discarded.
+        errors: t.List[t.Union[ValueError, t.Pattern[str]]] = []
 
-        for regex, conv in zip(self.regex, self.converters_to):
+        for regex, conv, spec in zip(self.regex, self._converters_to, self._converter_specs):
             if regex not in match_cache:
                 if regex.fullmatch(argument):
                     match_cache.add(regex)
                 else:
-                    errors.append(
-                        exceptions.MatchFailure(
-                            f"Input '{argument}' did not match r'{regex.pattern}'.",
-                            self.param,
-                            regex,
-                        )
-                    )
+                    errors.append(regex)
                     continue
 
             try:
-                return await self._actual_conversion(argument, conv, **kwargs)
+                return await self._actual_conversion(argument, conv, spec, **kwargs)
             except ValueError as exc:
                 errors.append(exc)
 
-        return self.default, errors
+        return self.default, [
+            exceptions.MatchFailure(
+                f"Input '{argument}' did not match r'{error.pattern}'.", self.param, error
+            )
+            if isinstance(error, re.Pattern)
+            else error
+            for error in errors
+        ]
 
     async def _actual_conversion(
         self,
         argument: str,
         conv: converter.ConverterSig,
+        spec: t.Optional[ConverterSpec] = None,
         **kwargs: t.Any,
     ) -> t.Tuple[t.Any, t.List[ValueError]]:
         """For internal use only. Actually run a converter on an argument and return the result.
         Raises whatever the converter function may raise. Generally speaking, this should only be
         :class:`ValueError`s.
         """
-        converter_signature = params.signature(  # pyright: ignore
-            conv.__new__ if isinstance(conv, type) else conv
-        ).parameters
-
-        converted = conv(
-            argument,
-            **{key: value for key, value in kwargs.items() if key in converter_signature},
-        )
-
-        if inspect.isawaitable(converted):
+        if conv is str:
+            # The argument already is a string, so there is nothing to convert.
+            return argument, []
+
+        # Converters that could not be inspected up front are inspected here, such that any
+        # resulting error is raised during conversion.
+        converter_params, is_async = spec or _get_converter_spec(conv)
+
+        if converter_params.isdisjoint(kwargs):
+            # Plain converters such as `int` take none of the extras; avoid building a dict.
+            converted = conv(argument)
+        else:
+            converted = conv(
+                argument,
+                **{key: value for key, value in kwargs.items() if key in converter_params},
+            )
+
+        # Sync converters may still return awaitables, so those need to be checked.
+        if is_async or inspect.isawaitable(converted):
             return await converted, []
         return converted, []
 
@@ -393,6 +404,9 @@ class ParamInfo:
         for conv in self.converters_from:
             try:
                 converted = conv(argument)
+                # Nearly all converters are synchronous and return a str; skip the awaitable check.
+                if type(converted) is str:
+                    return converted
                 if inspect.isawaitable(converted):
                     return await converted
                 return converted  # type: ignore  # Type not correctly narrowed.
@@ -405,7 +419,113 @@ class ParamInfo:
         )
 
 
+def _get_converter_spec(conv: converter.ConverterSig) -> ConverterSpec:
+    """Get the names of the parameters a converter function accepts, and whether it is a coroutine
+    function.
+    """
+    target = conv.__new__ if isinstance(conv, type) else conv
+    signature = params.signature(target)  # pyright: ignore
+    return frozenset(signature.parameters), asyncio.iscoroutinefunction(conv)  # pyright: ignore
+
+
+def _try_get_converter_spec(conv: converter.ConverterSig) -> t.Optional[ConverterSpec]:
+    """Get the spec of a converter function, or ``None`` if it cannot be inspected."""
+    try:
+        return _get_converter_spec(conv)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_collection_type(obj: t.Any) -> bool:
+    """Check whether an object is a collection type without relying on :func:`issubclass`
+    raising :class:`TypeError` for objects that aren't classes. The builtin collections are
+    checked first, as they are by far the most common and skip the ABC subclass hook.
+    """
+    return obj in _BuiltinCollectionTypes or (
+        isinstance(obj, type) and issubclass(obj, collections.abc.Collection)
+    )
+
+
+def _parse_annotation(annotation: t.Any) -> ParsedAnnotation:
+    """Parse an annotation into the corresponding regex patterns and converter functions."""
+    if isinstance(annotation, types_.Converted):
+        return _parse_converted(annotation)
+
+    if not (origin := types_.get_origin(annotation)):
+        return _parse_type(annotation)
+
+    elif origin in _UnionTypes:
+        return _parse_union(annotation)
+
+    elif origin is t.Literal:
+        return _parse_literal(annotation)
+
+    if _is_collection_type(origin):
+        # Ignore collection and parse first underlying type. Collection parsing is handled
+        # by input to :meth:`ParamInfo.convert` instead.
+        return _parse_annotation(args[0] if (args := types_.get_args(annotation)) else str)
+
+    raise TypeError(f"{annotation!r} is not a valid type annotation for a listener.")
+
+
+def _parse_type(annotation: t.Any) -> ParsedAnnotation:
+    """Parse a plain type annotation into the corresponding regex pattern and converter functions."""
+    conv_to, conv_from = converter.CONVERTER_MAP[annotation]
+    return (REGEX_MAP[annotation],), (conv_to,), (conv_from,), False
+
+
+def _parse_union(annotation: t.Any) -> ParsedAnnotation:
+    """Parse a :class:`typing.Union` annotation into the corresponding regex patterns and
+    converter functions. Any ``None``s are removed from the union, and instead mark the
+    annotation as optional.
+    """
+    regex: t.Tuple[t.Pattern[str], ...] = ()
+    conv_to: t.Tuple[converter.ConverterSig, ...] = ()
+    conv_from: t.Tuple[converter.ConverterSig, ...] = ()
+    optional = False
+
+    for arg in types_.get_args(annotation):
+        if arg in _NoneTypes:
+            optional = True
+            continue
+
+        arg_regex, arg_conv_to, arg_conv_from, arg_optional = _parse_annotation(arg)
+        regex += arg_regex
+        conv_to += arg_conv_to
+        conv_from += arg_conv_from
+        optional |= arg_optional
+
+    return regex, conv_to, conv_from, optional
+
+
+def _parse_literal(annotation: t.Any) -> ParsedAnnotation:
+    """Parse a :class:`typing.Literal` annotation into the corresponding regex patterns and
+    converter functions. Consecutive arguments of the same type share a single pattern and
+    converter, such that e.g. ``Literal["a", "b", "c"]`` only needs to be matched once.
+    """
+    regex: t.List[t.Pattern[str]] = []
+    conv_to: t.List[converter.ConverterSig] = []
+    conv_from: t.List[converter.ConverterSig] = []
+
+    for arg_type, args in itertools.groupby(types_.get_args(annotation), key=type):
+        regex.append(re.compile("|".join(re.escape(str(arg)) for arg in args)))
+        arg_conv_to, arg_conv_from = converter.CONVERTER_MAP[arg_type]
+        conv_to.append(arg_conv_to)
+        conv_from.append(arg_conv_from)
+
+    return tuple(regex), tuple(conv_to), tuple(conv_from), False
+
+
+def _parse_converted(annotation: types_.Converted) -> ParsedAnnotation:
+    """Parse a :class:`.Converted` annotation into the corresponding regex patterns and
+    converter functions.
+    """
+    return (annotation.regex,), (annotation.converter_to,), (annotation.converter_from,), False
+
+
 class _SelectValue:
+    __slots__ = ("placeholder", "min_values", "max_values", "options", "disabled")
+
     def __init__(
         self,
         placeholder: t.Optional[str] = None,
@@ -469,6 +589,8 @@ def SelectValue(
 
 
 class _ModalValue:
+    __slots__ = ("placeholder", "label", "value", "required", "min_length", "max_length", "style")
+
     def __init__(
         self,
         placeholder: t.Optional[str] = None,
@@ -258,9 +258,10 @@ class AbstractComponent:
         return AbstractComponent(**dict(self))
 
     def with_overrides(self, **kwargs: t.Any):
-        copy = self.copy()
-        copy.__init__(**{k: v for k, v in kwargs.items() if v is not None})
-        return copy
+        # Merge before instantiating, such that only a single copy is made and options are not
+        # parsed twice when they are overridden.
+        overrides = {k: v for k, v in kwargs.items() if v is not None}
+        return AbstractComponent(**{**dict(self), **overrides})
 
     def as_component(self, template: t.Type[MessageComponentT]) -> MessageComponentT:
         kwargs = dict(self)
@@ -1,3 +1,4 @@
+import asyncio
 import inspect
 import re
 import typing as t
@@ -12,8 +13,11 @@ __all__ = [
     "id_spec_from_regex",
     "extract_listener_params",
     "ensure_compiled",
+    "build_components",
 ]
 
+T = t.TypeVar("T")
+
 
 def id_spec_from_signature(name: str, sep: str, signature: inspect.Signature) -> str:
     """Analyze a function signature to create a format string for creating new custom_ids.
@@ -204,3 +208,32 @@ def build_component_matching_check(
         return check_component == inter.component
 
     return check
+
+
+async def build_components(*builds: t.Awaitable[T]) -> t.List[T]:
+    """Concurrently run multiple component builds, e.g. calls to a listener's `build_component`.
+    As building a component may have to convert parameters to their string form using async
+    converters, this is preferred over awaiting each build in turn when building multiple
+    components at once, e.g. to send a full set of components with a message.
+
+    Example
+    -------
+
+    ```py
+    button, select = await components.utils.build_components(
+        my_button_listener.build_component(label="Click me!", foo=1),
+        my_select_listener.build_component(placeholder="Pick one!", bar="a"),
+    )
+    ```
+
+    Parameters
+    ----------
+    *builds: :class:`typing.Awaitable`
+        The component builds to run.
+
+    Returns
+    -------
+    List[:class:`Any`]
+        The built components, in the same order as the builds were provided.
+    """
+    return list(await asyncio.gather(*builds))
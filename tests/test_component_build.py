@@ -63,3 +63,19 @@ async def test_build_from_kwargs(
 
     built = await listener.build_component(**overrides)
     assert built.to_component_dict() == expected.to_component_dict()
+
+
+@pytest.mark.asyncio()
+async def test_build_select_literal_options():
+    @components.select_listener()
+    async def listener(inter: disnake.MessageInteraction, selected: t.Literal["a", "b", 1]):
+        ...
+
+    assert listener.literal_options == ("a", "b", "1")
+
+    for _ in range(2):  # Ensure repeated builds don't share state.
+        built = await listener.build_component()
+        assert [option.label for option in built.options] == ["a", "b", "1"]
+
+    built = await listener.build_component(options=["c"])
+    assert [option.label for option in built.options] == ["c"]
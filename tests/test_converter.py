@@ -0,0 +1,66 @@
+import typing as t
+from unittest import mock
+
+import disnake
+import pytest
+
+import disnake_ext_components as components
+
+# converter.member_converter
+
+
+def make_guild(member: t.Optional[disnake.Member] = None, fetch_error: bool = False) -> mock.Mock:
+    guild = mock.Mock(spec=disnake.Guild)
+    guild.get_member.return_value = None
+    if fetch_error:
+        guild.fetch_member = mock.AsyncMock(side_effect=disnake.NotFound(mock.Mock(), "bean"))
+    else:
+        guild.fetch_member = mock.AsyncMock(return_value=member)
+    return guild
+
+
+@pytest.mark.asyncio()
+async def test_member_converter_prefers_cache(
+    msg_inter: mock.Mock, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(components.converter.ALLOW_CONVERTER_FETCHING, "USERS", True)
+
+    member = mock.Mock(spec=disnake.Member)
+    msg_inter.guild = make_guild()
+    cached_guild = make_guild()
+    cached_guild.get_member.return_value = member
+
+    assert await components.converter.member_converter("1", msg_inter, [cached_guild]) is member
+    msg_inter.guild.fetch_member.assert_not_awaited()
+
+
+@pytest.mark.asyncio()
+async def test_member_converter_fetch(msg_inter: mock.Mock, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(components.converter.ALLOW_CONVERTER_FETCHING, "USERS", True)
+
+    member = mock.Mock(spec=disnake.Member)
+    msg_inter.guild = make_guild(fetch_error=True)
+    other_guild = make_guild(member)
+
+    assert await components.converter.member_converter("1", msg_inter, [other_guild]) is member
+    msg_inter.guild.fetch_member.assert_awaited_once_with(1)
+
+
+@pytest.mark.asyncio()
+async def test_member_converter_fetch_error(msg_inter: mock.Mock, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(components.converter.ALLOW_CONVERTER_FETCHING, "USERS", True)
+
+    msg_inter.guild = make_guild(fetch_error=True)
+
+    with pytest.raises(disnake.NotFound):
+        await components.converter.member_converter("1", msg_inter)
+
+
+@pytest.mark.asyncio()
+async def test_member_converter_no_fetch(msg_inter: mock.Mock):
+    msg_inter.guild = make_guild(mock.Mock(spec=disnake.Member))
+
+    with pytest.raises(ValueError, match="Could not find a member with id 1."):
+        await components.converter.member_converter("1", msg_inter)
+
+    msg_inter.guild.fetch_member.assert_not_awaited()
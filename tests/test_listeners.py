@@ -1,6 +1,7 @@
 # TODO: Add more tests to ensure proper functionality before pypi release!
 
 import typing as t
+from unittest import mock
 
 import disnake
 import pytest
@@ -76,3 +77,119 @@ def test_listener_name_override_modal():
 #
 #       I will therefore probably end up slightly reworking match_component first,
 #       before continuing with these tests.
+
+
+# abc.BaseListener.build_custom_id
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("decorator_kwargs", "expected"),
+    [
+        ({}, "callback:1:abc"),
+        ({"sep": "|"}, "callback|1|abc"),
+        ({"regex": r"custom:(?P<foo>\d+):(?P<bar>.*)"}, "custom:1:abc"),
+    ],
+)
+async def test_build_custom_id(decorator_kwargs: t.Dict[str, t.Any], expected: str):
+    @components.button_listener(**decorator_kwargs)
+    async def callback(inter: disnake.MessageInteraction, *, foo: int, bar: str):
+        ...
+
+    assert await callback.build_custom_id(1, "abc") == expected
+    assert await callback.build_custom_id(foo=1, bar="abc") == expected
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("regex", "custom_id"),
+    [
+        (r"foo\{(?P<foo>\d+)\}", "foo{1}"),
+        (r"foo}(?P<foo>\d+)", "foo}1"),
+    ],
+)
+async def test_regex_with_braces(regex: str, custom_id: str):
+    @components.button_listener(regex=regex)
+    async def callback(inter: disnake.MessageInteraction, *, foo: int):
+        ...
+
+    # Matching works, but the regex does not make for a valid custom_id spec.
+    assert callback.parse_custom_id(custom_id) == ("1",)
+
+    with pytest.raises(ValueError):
+        await callback.build_custom_id(1)
+
+
+# abc.BaseListener.parse_custom_id
+
+
+@pytest.mark.parametrize(
+    ("custom_id", "expected"),
+    [
+        ("callback:1:abc", ("1", "abc")),
+        ("callback:1:", ("1", "")),
+    ],
+)
+def test_parse_custom_id(custom_id: str, expected: t.Tuple[str, ...]):
+    @components.button_listener()
+    async def callback(inter: disnake.MessageInteraction, *, foo: int, bar: str):
+        ...
+
+    assert callback.parse_custom_id(custom_id) == expected
+
+
+@pytest.mark.parametrize("custom_id", ["other:1:abc", "callbacks:1:abc", "callback:1", "callback"])
+def test_parse_custom_id_mismatch(custom_id: str):
+    @components.button_listener()
+    async def callback(inter: disnake.MessageInteraction, *, foo: int, bar: str):
+        ...
+
+    with pytest.raises(ValueError):
+        callback.parse_custom_id(custom_id)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(("custom_id", "expected"), [("magic", 5), ("callback:5", None)])
+async def test_parse_custom_id_override(
+    custom_id: str, expected: t.Optional[int], msg_inter: mock.Mock
+):
+    class MagicListener(components.ButtonListener[t.Any, t.Any]):
+        def parse_custom_id(self, custom_id: str) -> t.Tuple[str, ...]:
+            if custom_id != "magic":
+                raise ValueError("Not magic.")
+            return ("5",)
+
+    async def callback(inter: disnake.MessageInteraction, *, foo: int) -> int:
+        return foo
+
+    listener = MagicListener(callback)
+    msg_inter.component.custom_id = custom_id
+
+    assert await listener(msg_inter) == expected
+
+
+# listener.SelectListener.__call__
+
+
+@pytest.mark.asyncio()
+async def test_select_lookback(msg_inter: mock.Mock):
+    @components.select_listener()
+    async def callback(
+        inter: disnake.MessageInteraction,
+        members: t.List[disnake.Member] = components.SelectValue("bean"),
+        *,
+        guild: disnake.Guild,
+    ) -> t.List[disnake.Member]:
+        return members
+
+    member = mock.Mock(spec=disnake.Member)
+    guild = mock.Mock(spec=disnake.Guild)
+    guild.get_member.return_value = member
+
+    msg_inter.guild = None  # The member can only be found through the converted guild.
+    msg_inter.bot.get_guild.return_value = guild
+    msg_inter.component.custom_id = "callback:123456789012345678"
+    msg_inter.values = ["876543210987654321"]
+
+    assert await callback(msg_inter) == [member]
+    guild.get_member.assert_called_once_with(876543210987654321)
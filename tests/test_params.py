@@ -1,4 +1,6 @@
+import dataclasses
 import datetime
+import functools
 import inspect
 import typing as t
 
@@ -153,6 +155,16 @@ async def test_optional_paraminfo_with_default():
     assert await paraminfo.convert("") == default
 
 
+def test_optional_paraminfo_unhashable_default():
+    param = param_from_annotation(t.List[str], default=components.params._SelectValue(min_values=0))
+    paraminfo = components.params.ParamInfo.from_param(param)
+
+    assert paraminfo.default == []
+    assert paraminfo.default is not paraminfo.default  # Must not share mutable defaults.
+    assert paraminfo.optional is True
+    assert paraminfo.container_type is list
+
+
 # params.ParamInfo | t.Union
 
 
@@ -194,6 +206,20 @@ async def test_literal_paraminfo():
         await paraminfo.convert("something else")
 
 
+@pytest.mark.asyncio()
+async def test_homogeneous_literal_paraminfo():
+    param = param_from_annotation(t.Literal["a", "b", "ab"])
+    paraminfo = components.params.ParamInfo.from_param(param)
+
+    assert len(paraminfo.regex) == 1
+
+    assert await paraminfo.convert("a") == "a"
+    assert await paraminfo.convert("ab") == "ab"
+
+    with pytest.raises(components.ConversionError):
+        await paraminfo.convert("abc")
+
+
 # params.ParamInfo | t.Collection
 
 
@@ -254,6 +280,70 @@ async def test_converted_paraminfo(
     assert await paraminfo.to_str(dt) == "0"
 
 
+@pytest.mark.asyncio()
+async def test_converted_collection_paraminfo_async():
+    param = param_from_annotation(
+        t.List[
+            components.Converted[components.patterns.STRICTINT, to_datetime_async, from_datetime]
+        ]
+    )
+    paraminfo = components.params.ParamInfo.from_param(param)
+
+    # Async converters run concurrently, but the original order must be preserved.
+    assert await paraminfo.convert(["0", "60", "120"]) == [
+        datetime.datetime(1970, 1, 1, minute=minute, tzinfo=utc) for minute in (0, 1, 2)
+    ]
+
+    with pytest.raises(components.ConversionError):
+        await paraminfo.convert(["0", "abc", "120"])
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("wrap", "expected"),
+    [
+        (lambda a: a, 255),
+        (lambda a: t.Optional[a], 255),
+        (lambda a: t.List[a], [255]),
+    ],
+)
+async def test_converted_nameless_converter_paraminfo(
+    wrap: t.Callable[[t.Any], t.Any], expected: t.Any
+):
+    conv_to = functools.partial(lambda arg, base: int(arg, base), base=16)
+    param = param_from_annotation(wrap(components.Converted["ff", conv_to, str]))
+    paraminfo = components.params.ParamInfo.from_param(param)
+
+    assert await paraminfo.convert("ff") == expected
+
+
+@pytest.mark.asyncio()
+async def test_converted_unhashable_converter_paraminfo():
+    @dataclasses.dataclass
+    class ToInt:
+        base: int = 10
+
+        def __call__(self, arg: str) -> int:
+            return int(arg, self.base)
+
+    param = param_from_annotation(components.Converted[components.patterns.STRICTINT, ToInt(), str])
+    paraminfo = components.params.ParamInfo.from_param(param)
+
+    assert await paraminfo.convert("12") == 12
+
+
+@pytest.mark.parametrize("annotation", [int, t.Optional[int], t.List[int]])
+def test_converter_map_changes_paraminfo(annotation: t.Any, monkeypatch: pytest.MonkeyPatch):
+    def to_int(arg: str) -> int:
+        return int(arg)
+
+    param = param_from_annotation(annotation)
+    assert components.params.ParamInfo.from_param(param).converters_to == (int,)
+
+    monkeypatch.setitem(components.CONVERTER_MAP, int, (to_int, str))  # type: ignore
+    assert components.params.ParamInfo.from_param(param).converters_to == (to_int,)
+
+
 # params.ParamInfo | exc
 
 
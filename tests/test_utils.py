@@ -102,3 +102,22 @@ def test_regex_spec():
 
     spec = components.utils.id_spec_from_regex(pat)
     assert spec == "something:{foo}:{bar}"
+
+
+# utils.build_components
+
+
+@pytest.mark.asyncio()
+async def test_build_components(button_listener_callback: t.Callable[..., t.Any]):
+    listener = components.button_listener()(button_listener_callback)
+
+    built = await components.utils.build_components(
+        listener.build_component(label="a", foo=1, bar="x"),
+        listener.build_component(label="b", foo=2, bar="y"),
+    )
+
+    assert [button.label for button in built] == ["a", "b"]
+    assert [button.custom_id for button in built] == [
+        "button_listener_callback:1:x",
+        "button_listener_callback:2:y",
+    ]